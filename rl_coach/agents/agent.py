@@ -16,7 +16,6 @@
 
 import copy
 import random
-from collections import OrderedDict
 from typing import Dict, List, Union, Tuple
 
 import numpy as np
@@ -168,6 +167,11 @@ class Agent(AgentInterface):
         self.exploration_policy = None
         self.networks = {}
         self.last_action_info = None
+        self.log_episodes_to_screen = True
+        self.replay_dtype = self._get_replay_dtype(self.ap.algorithm.replay_dtype)
+        # the next state of the last stored transition, before and after casting it to the replay dtype
+        self._last_next_state = None
+        self._last_cast_next_state = None
         self.running_observation_stats = None
         self.running_reward_stats = None
         self.accumulated_rewards_across_evaluation_episodes = 0
@@ -470,7 +474,7 @@ class Agent(AgentInterface):
         :return: None
         """
         # log to screen
-        log = OrderedDict()
+        log = {}
         log["Name"] = self.full_name_id
         if self.task_id is not None:
             log["Worker"] = self.task_id
@@ -596,7 +600,7 @@ class Agent(AgentInterface):
 
         # TODO verbosity was mistakenly removed from task_parameters on release 0.11.0, need to bring it back
         # if self.ap.is_a_highest_level_agent or self.ap.task_parameters.verbosity == "high":
-        if self.ap.is_a_highest_level_agent:
+        if self.ap.is_a_highest_level_agent and self.log_episodes_to_screen:
             self.log_to_screen()
 
     def reset_internal_state(self) -> None:
@@ -613,6 +617,8 @@ class Agent(AgentInterface):
         self.total_shaped_reward_in_current_episode = 0
         self.total_reward_in_current_episode = 0
         self.curr_state = {}
+        self._last_next_state = None
+        self._last_cast_next_state = None
         self.current_episode_steps_counter = 0
         self.episode_running_info = {}
         self.current_episode_buffer = Episode(discount=self.ap.algorithm.discount, n_step=self.ap.algorithm.n_step)
@@ -959,6 +965,9 @@ class Agent(AgentInterface):
 
         # create and store the transition
         if self.phase in [RunPhase.TRAIN, RunPhase.HEATUP]:
+            if self.replay_dtype is not None:
+                self._cast_transition_observations(transition)
+
             # for episodic memories we keep the transitions in a local buffer until the episode is ended.
             # for regular memories we insert the transitions directly to the memory
             self.current_episode_buffer.insert(transition)
@@ -971,6 +980,57 @@ class Agent(AgentInterface):
 
         return transition.game_over
 
+    @staticmethod
+    def _get_replay_dtype(replay_dtype) -> Union[np.dtype, None]:
+        """
+        Validate the replay dtype of the algorithm parameters
+
+        :param replay_dtype: the replay dtype set in the algorithm parameters, or None
+        :return: the replay dtype as a numpy dtype, or None if the observations should not be cast
+        """
+        if replay_dtype is None:
+            return None
+        replay_dtype = np.dtype(replay_dtype)
+        if not np.issubdtype(replay_dtype, np.floating):
+            raise ValueError("The replay dtype must be a floating point dtype, but {} was given".format(replay_dtype))
+        return replay_dtype
+
+    def _cast_transition_observations(self, transition: Transition) -> None:
+        """
+        Downcast the floating point observations of a transition to the replay dtype. The state of a transition holds
+        the same observations as the next state of the previous one, so the cast of that next state is reused instead
+        of casting the observations again. This keeps the observations shared between consecutive transitions, in the
+        memory and in the pickled episodes.
+
+        :param transition: the transition to cast
+        :return: None
+        """
+        last_next_state = self._last_next_state
+        if last_next_state is not None and transition.state.keys() == last_next_state.keys() \
+                and all(transition.state[key] is last_next_state[key] for key in transition.state):
+            transition.state = copy.copy(self._last_cast_next_state)
+        else:
+            transition.state = self._cast_observations(transition.state)
+
+        self._last_next_state = transition.next_state
+        self._last_cast_next_state = transition.next_state = self._cast_observations(transition.next_state)
+
+    def _cast_observations(self, state: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Downcast the floating point observations of a state to the replay dtype. Observations which are not floating
+        point (e.g. uint8 images) or which are already narrow enough are kept as is.
+
+        :param state: the state to cast
+        :return: a new state dictionary holding the cast observations
+        """
+        cast_state = {}
+        for key, observation in state.items():
+            if isinstance(observation, np.ndarray) and np.issubdtype(observation.dtype, np.floating) \
+                    and observation.dtype.itemsize > self.replay_dtype.itemsize:
+                observation = observation.astype(self.replay_dtype)
+            cast_state[key] = observation
+        return cast_state
+
     def post_training_commands(self) -> None:
         """
         A function which allows adding any functionality that is required to run right after the training phase ends.
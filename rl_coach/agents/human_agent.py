@@ -15,7 +15,6 @@
 #
 
 import os
-from collections import OrderedDict
 from typing import Union
 
 import contextlib
@@ -110,7 +109,7 @@ class HumanAgent(Agent):
 
     def log_to_screen(self):
         # log to screen
-        log = OrderedDict()
+        log = {}
         log["Episode"] = self.current_episode
         log["Total reward"] = round(self.total_reward_in_current_episode, 2)
         log["Steps"] = self.total_steps_counter
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 
-from collections import OrderedDict
 from typing import Union
 
 from rl_coach.agents.agent import Agent
@@ -50,7 +49,7 @@ class ImitationAgent(Agent):
         # log to screen
         if self.phase == RunPhase.TRAIN:
             # for the training phase - we log during the episode to visualize the progress in training
-            log = OrderedDict()
+            log = {}
             if self.task_id is not None:
                 log["Worker"] = self.task_id
             log["Episode"] = self.current_episode
@@ -14,7 +14,6 @@
 # limitations under the License.
 #
 
-from collections import OrderedDict
 from enum import Enum
 from typing import Union
 
@@ -59,7 +58,7 @@ class PolicyOptimizationAgent(Agent):
 
     def log_to_screen(self):
         # log to screen
-        log = OrderedDict()
+        log = {}
         log["Name"] = self.full_name_id
         if self.task_id is not None:
             log["Worker"] = self.task_id
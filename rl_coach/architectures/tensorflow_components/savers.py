@@ -72,11 +72,13 @@ class GlobalVariableSaver(Saver):
             k.name.split(":")[0]: v for k, v in zip(self._variables, session.run(self._variables))
         }
 
-    def from_arrays(self, session: Any, tensors: Any):
+    def from_arrays(self, session: Any, tensors: Any, partial: bool=False):
         """
         Restore from restore_path
         :param sess: active session for session-based frameworks (e.g. TF)
         :param tensors: {name: array}
+        :param partial: if True, only the variables given in tensors are assigned, and all the other variables keep
+                        their current values
         """
         # if variable was saved using global network, re-map it to online
         # network
@@ -87,12 +89,24 @@ class GlobalVariableSaver(Saver):
 
         variables = {k.replace("global/", "online/"): v for k, v in tensors}
 
-        # Assign all variables using placeholder
-        placeholder_dict = {
-            ph: variables[v.name.split(":")[0]]
-            for ph, v in zip(self._variable_placeholders, self._variables)
-        }
-        session.run(self._variable_update_ops, placeholder_dict)
+        if not partial:
+            # Assign all variables using placeholder
+            placeholder_dict = {
+                ph: variables[v.name.split(":")[0]]
+                for ph, v in zip(self._variable_placeholders, self._variables)
+            }
+            session.run(self._variable_update_ops, placeholder_dict)
+            return
+
+        update_ops = []
+        placeholder_dict = {}
+        for ph, update_op, v in zip(self._variable_placeholders, self._variable_update_ops, self._variables):
+            name = v.name.split(":")[0]
+            if name in variables:
+                update_ops.append(update_op)
+                placeholder_dict[ph] = variables[name]
+        if update_ops:
+            session.run(update_ops, placeholder_dict)
 
     def to_string(self, session: Any) -> str:
         """
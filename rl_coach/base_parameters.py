@@ -207,6 +207,10 @@ class AlgorithmParameters(Parameters):
         # Distributed Coach params
         self.distributed_coach_synchronization_type = None
 
+        # The floating point observations of the transitions stored in the replay buffer (and sent to the training
+        # worker in distributed Coach) are downcast to this dtype, e.g. np.float16. None keeps the original dtype.
+        self.replay_dtype = None
+
         # Should the workers wait for full episode
         self.act_for_full_episodes = False
 
@@ -23,6 +23,12 @@ from typing import List, Union, Dict, Any, Type
 
 import numpy as np
 
+# numba is an optional dependency, used only to speed up the per episode return calculations
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from rl_coach.utils import force_list
 
 ActionType = Union[int, float, np.ndarray, List]
@@ -693,6 +699,42 @@ class GradientClippingMethod(Enum):
     ClipByValue = 2
 
 
+def _n_step_discounted_rewards_numpy(rewards: np.ndarray, discount: float, n_step: int) -> np.ndarray:
+    """
+    Sum the discounted rewards of the next n_step transitions for each of the transitions in an episode
+
+    :param rewards: the rewards of all the transitions in the episode
+    :param discount: the discount factor
+    :param n_step: the number of future rewards to sum
+    :return: the n-step discounted rewards of all the transitions in the episode
+    """
+    discounted_rewards = rewards.copy()
+    current_discount = discount
+    for i in range(1, n_step):
+        discounted_rewards += current_discount * np.pad(rewards[i:], (0, i), 'constant', constant_values=0)
+        current_discount *= discount
+    return discounted_rewards
+
+
+_n_step_discounted_rewards = _n_step_discounted_rewards_numpy
+
+if numba is not None:
+    # the same calculation as above, compiled to a single pass over the rewards. the rewards are accumulated in the
+    # same order, so both versions return identical results.
+    @numba.njit(cache=True)
+    def _n_step_discounted_rewards_numba(rewards, discount, n_step):
+        length = rewards.shape[0]
+        discounted_rewards = rewards.copy()
+        for i in range(length):
+            current_discount = discount
+            for j in range(i + 1, min(i + n_step, length)):
+                discounted_rewards[i] += current_discount * rewards[j]
+                current_discount *= discount
+        return discounted_rewards
+
+    _n_step_discounted_rewards = _n_step_discounted_rewards_numba
+
+
 class Episode(object):
     """
     An Episode represents a set of sequential transitions, that end with a terminal state.
@@ -784,10 +826,9 @@ class Episode(object):
 
         rewards = np.array([t.reward for t in self.transitions])
         rewards = rewards.astype('float')
-        discounted_rewards = rewards.copy()
+        discounted_rewards = _n_step_discounted_rewards(rewards, self.discount, curr_n_step)
         current_discount = self.discount
         for i in range(1, curr_n_step):
-            discounted_rewards += current_discount * np.pad(rewards[i:], (0, i), 'constant', constant_values=0)
             current_discount *= self.discount
 
         # calculate the bootstrapped returns
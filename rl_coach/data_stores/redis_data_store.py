@@ -15,9 +15,12 @@
 # limitations under the License.
 #
 
+import hashlib
+import pickle
 import time
 import uuid
 
+import numpy as np
 import redis
 
 from rl_coach.architectures.tensorflow_components.savers import GlobalVariableSaver
@@ -60,12 +63,21 @@ class RedisDataStore(DataStore):
     could result in a race condition where the master worker publishes the first policy and waits
     for the rollout workers to submit all rollouts, while a delayed rollout worker waits for the
     first policy since it subscribed to the channel after the initial policy was published.
+
+    Each policy variable is stored separately in a redis hash, together with a digest of its
+    value. The training worker only sends the variables whose value changed since the previous
+    policy, and rollout workers only fetch the variables whose digest differs from the one they
+    last loaded. This keeps the traffic low when only part of the network changes, like in
+    multi-head setups.
     """
 
     def __init__(self, params: RedisDataStoreParameters):
         self.params = params
         self.saver = None
         self._end_of_policies = False
+        self._loaded_policy_id = None
+        self._published_digests = {}
+        self._loaded_digests = {}
 
         # NOTE: a connection is not attempted at this stage because the address and port are likely
         # not available yet. This is because of how the kubernetes orchestrator works. At the time
@@ -125,19 +137,101 @@ class RedisDataStore(DataStore):
             self._connect()
             self.pubsub.unsubscribe(self.params.redis_channel)
 
-        policy_string = self.saver.to_string(graph_manager.sess)
-        self.redis_connection.set(self.params.redis_channel, policy_string)
-        self.redis_connection.publish(self.params.redis_channel, "new_policy")
+        arrays = self.saver.to_arrays(graph_manager.sess)
+
+        # if some of the stored variables were lost, e.g. because redis was restarted, all the variables are sent again
+        if self._published_digests and self.redis_connection.hlen(self._variable_digests_key) < len(arrays):
+            self._published_digests = {}
+
+        changed_variables = {}
+        changed_digests = {}
+        for name, array in arrays.items():
+            digest = self._digest(array)
+            if self._published_digests.get(name) != digest:
+                changed_variables[name] = pickle.dumps(array, protocol=-1)
+                changed_digests[name] = digest
+
+        # the changed variables, the policy id and the notification are sent in a single round trip. executing them
+        # as a transaction means the policy id and the stored variables are always updated together. the rollout
+        # workers read them in transactions as well, see _load_policy.
+        pipeline = self.redis_connection.pipeline(transaction=True)
+        if changed_variables:
+            pipeline.hmset(self._variables_key, changed_variables)
+            pipeline.hmset(self._variable_digests_key, changed_digests)
+        pipeline.incr(self._policy_id_key)
+        pipeline.publish(self.params.redis_channel, "new_policy")
+        pipeline.execute()
+
+        self._published_digests.update(changed_digests)
+
+    @staticmethod
+    def _digest(array: np.ndarray) -> bytes:
+        return hashlib.blake2b(np.ascontiguousarray(array).tobytes(), digest_size=16).digest()
+
+    @property
+    def _policy_id_key(self) -> str:
+        return "{}-policy-id".format(self.params.redis_channel)
+
+    @property
+    def _variables_key(self) -> str:
+        return "{}-variables".format(self.params.redis_channel)
+
+    @property
+    def _variable_digests_key(self) -> str:
+        return "{}-variable-digests".format(self.params.redis_channel)
+
+    def current_policy_id(self):
+        """
+        :return: the id of the most recent policy saved to redis, or None if no policy was saved yet
+        """
+        policy_id = self.redis_connection.get(self._policy_id_key)
+        if policy_id is None:
+            return None
+        return int(policy_id)
 
     def _load_policy(self, graph_manager) -> bool:
         """
-        Get the most recent policy from redis and loaded into the graph_manager
+        Get the most recent policy from redis and loaded into the graph_manager. Nothing is fetched if the policy is
+        the one which was already loaded by this process, and otherwise only the variables that changed since the
+        last load are fetched and assigned.
         """
-        policy_string = self.redis_connection.get(self.params.redis_channel)
-        if policy_string is None:
-            return False
+        while True:
+            # the policy id and the digests are read in a single transaction, so that they always describe the same
+            # policy
+            pipeline = self.redis_connection.pipeline(transaction=True)
+            pipeline.get(self._policy_id_key)
+            pipeline.hgetall(self._variable_digests_key)
+            policy_id, digests = pipeline.execute()
+            if policy_id is not None and int(policy_id) == self._loaded_policy_id:
+                return True
+            if not digests:
+                return False
+
+            changed_names = [name for name, digest in digests.items() if self._loaded_digests.get(name) != digest]
+            if not changed_names:
+                break
+
+            # the variables are read together with the policy id. if a new policy was published since the digests
+            # were read, the variables may belong to a different policy, and everything is read again.
+            pipeline = self.redis_connection.pipeline(transaction=True)
+            pipeline.get(self._policy_id_key)
+            pipeline.hmget(self._variables_key, changed_names)
+            current_policy_id, serialized_variables = pipeline.execute()
+            if current_policy_id != policy_id:
+                continue
+
+            variables = {}
+            for name, serialized_variable in zip(changed_names, serialized_variables):
+                if serialized_variable is None:
+                    raise ValueError("The policy variable {} was not found in redis.".format(name.decode()))
+                variables[name.decode()] = pickle.loads(serialized_variable)
+
+            # the first load must contain all the variables of the policy
+            self.saver.from_arrays(graph_manager.sess, variables, partial=len(self._loaded_digests) > 0)
+            self._loaded_digests.update({name: digests[name] for name in changed_names})
+            break
 
-        self.saver.from_string(graph_manager.sess, policy_string)
+        self._loaded_policy_id = None if policy_id is None else int(policy_id)
         return True
 
     def load_policy(self, graph_manager, require_new_policy=True, timeout=0):
@@ -31,7 +31,7 @@ from rl_coach.environments.environment import Environment
 from rl_coach.level_manager import LevelManager
 from rl_coach.logger import screen, Logger
 from rl_coach.saver import SaverCollection
-from rl_coach.utils import set_cpu, start_shell_command_and_wait
+from rl_coach.utils import set_cpu, start_shell_command_and_wait, set_member_values_for_all
 from rl_coach.data_stores.data_store_impl import get_data_store as data_store_creator
 from rl_coach.memories.backend.memory_impl import get_memory_backend
 from rl_coach.data_stores.data_store import SyncFiles
@@ -357,6 +357,19 @@ class GraphManager(object):
         yield
         self.phase = old_phase
 
+    @contextlib.contextmanager
+    def episode_screen_logs_context(self, enabled):
+        """
+        Create a context which temporarily enables or disables the per episode screen logs of all the agents.
+        The previous value of each agent is restored afterwards.
+        """
+        agents = [agent for manager in self.level_managers for agent in manager.agents.values()]
+        old_values = [agent.log_episodes_to_screen for agent in agents]
+        set_member_values_for_all(agents, 'log_episodes_to_screen', enabled)
+        yield
+        for agent, old_value in zip(agents, old_values):
+            agent.log_episodes_to_screen = old_value
+
     def set_session(self, sess) -> None:
         """
         Set the deep learning framework session for all the modules in the graph
@@ -435,27 +448,55 @@ class GraphManager(object):
                 data_store = self.get_data_store(self.data_store_params)
                 data_store.load_from_store()
 
+        top_level_manager = self.top_level_manager
+        self._play_steps(steps, lambda: top_level_manager.step(None), wait_for_full_episodes)
+
+    def _play_steps(self, steps: PlayingStepsType, step_function, wait_for_full_episodes=False,
+                    count_at_least_one_step=False) -> None:
+        """
+        The control flow shared by acting on the environment and emulating acting on the trainer: reset the levels
+        when an episode ended, make a single step, and update the step and episode counters.
+        :param steps: the number of steps as a tuple of steps time and steps count
+        :param step_function: makes a single step and returns an object with a game_over flag (an env response or a
+                              transition), or None if there is nothing left to play
+        :param wait_for_full_episodes: if set, act for at least `steps`, but make sure that the last episode is complete
+        :param count_at_least_one_step: if set, each step is counted as at least one environment step, otherwise the
+                                        loop is stopped as soon as a step does not advance the environment
+        """
+        # the counters of the current phase are read directly on every step, instead of going through the
+        # current_step_counter property and the TotalStepsCounter comparison
+        counters = self.current_step_counter.counters
+        count_type = type(steps)
+        environment = self.environments[0]
+
         # perform several steps of playing
-        count_end = self.current_step_counter + steps
+        count_end = counters[count_type] + steps.num_steps
         result = None
-        while self.current_step_counter < count_end or (wait_for_full_episodes and result is not None and not result.game_over):
+        while counters[count_type] < count_end or (wait_for_full_episodes and result is not None and not result.game_over):
             # reset the environment if the previous episode was terminated
             if self.reset_required:
                 self.reset_internal_state()
 
-            steps_begin = self.environments[0].total_steps_counter
-            result = self.top_level_manager.step(None)
-            steps_end = self.environments[0].total_steps_counter
+            steps_begin = environment.total_steps_counter
+            result = step_function()
+            if result is None:
+                break
+            steps_end = environment.total_steps_counter
 
             if result.game_over:
                 self.handle_episode_ended()
                 self.reset_required = True
 
-            self.current_step_counter[EnvironmentSteps] += (steps_end - steps_begin)
+            # add the diff between the total steps before and after stepping, such that environment initialization
+            # steps (like in Atari) will not be counted.
+            steps_made = steps_end - steps_begin
+            if count_at_least_one_step:
+                steps_made = max(1, steps_made)
+            counters[EnvironmentSteps] += steps_made
 
             # if no steps were made (can happen when no actions are taken while in the TRAIN phase, either in batch RL
             # or in imitation learning), we force end the loop, so that it will not continue forever.
-            if (steps_end - steps_begin) == 0:
+            if steps_made == 0:
                 break
 
     def train_and_act(self, steps: StepMethod) -> None:
@@ -503,11 +544,16 @@ class GraphManager(object):
                 self.reset_internal_state(force_environment_reset=True)
                 self.sync()
 
+                # the global network can only change while evaluating if other workers keep training it, otherwise
+                # there is nothing new to copy into the local networks between episodes
+                sync_between_episodes = isinstance(self.task_parameters, DistributedTaskParameters)
+
                 # act for at least `steps`, though don't interrupt an episode
                 count_end = self.current_step_counter + steps
                 while self.current_step_counter < count_end:
                     self.act(EnvironmentEpisodes(1))
-                    self.sync()
+                    if sync_between_episodes:
+                        self.sync()
         if self.should_stop():
             self.flush_finished()
             screen.success("Reached required success rate. Exiting.")
@@ -685,32 +731,52 @@ class GraphManager(object):
         """
         self.verify_graph_was_created()
 
-        # perform several steps of playing
-        count_end = self.current_step_counter + steps
-        while self.current_step_counter < count_end:
-            # reset the environment if the previous episode was terminated
-            if self.reset_required:
-                self.reset_internal_state()
-
-            steps_begin = self.environments[0].total_steps_counter
-            self.top_level_manager.emulate_step_on_trainer(transition)
-            steps_end = self.environments[0].total_steps_counter
+        top_level_manager = self.top_level_manager
 
-            # add the diff between the total steps before and after stepping, such that environment initialization steps
-            # (like in Atari) will not be counted.
-            # We add at least one step so that even if no steps were made (in case no actions are taken in the training
-            # phase), the loop will end eventually.
-            self.current_step_counter[EnvironmentSteps] += max(1, steps_end - steps_begin)
+        def emulate_step():
+            top_level_manager.emulate_step_on_trainer(transition)
+            return transition
 
-            if transition.game_over:
-                self.handle_episode_ended()
-                self.reset_required = True
+        # we count at least one step so that even if no steps were made (in case no actions are taken in the training
+        # phase), the loop will end eventually.
+        self._play_steps(steps, emulate_step, count_at_least_one_step=True)
 
     def fetch_from_worker(self, num_consecutive_playing_steps=None):
         if hasattr(self, 'memory_backend'):
-            with self.phase_context(RunPhase.TRAIN):
-                for transition in self.memory_backend.fetch(num_consecutive_playing_steps):
-                    self.emulate_act_on_trainer(EnvironmentSteps(1), transition)
+            self.verify_graph_was_created()
+
+            top_level_manager = self.top_level_manager
+            agent = top_level_manager.acting_agent()
+            first_episode = agent.current_episode
+            transitions = iter(self.memory_backend.fetch(num_consecutive_playing_steps))
+
+            def emulate_step():
+                transition = next(transitions, None)
+                if transition is not None:
+                    top_level_manager.emulate_step_on_trainer(transition)
+                return transition
+
+            # all the fetched transitions are emulated in a single stepping loop, which ends with the fetch. each
+            # transition is counted as at least one step, since no steps are made on the trainer's environment.
+            with self.phase_context(RunPhase.TRAIN), self.episode_screen_logs_context(False):
+                first_step = self.current_step_counter[EnvironmentSteps]
+                self._play_steps(num_consecutive_playing_steps, emulate_step, count_at_least_one_step=True)
+                steps_fetched = self.current_step_counter[EnvironmentSteps] - first_step
+
+            # a single summary line is logged for all the fetched episodes instead of one line per episode. the
+            # fetched episodes and steps are read from the counters once, instead of being counted per transition.
+            episodes_fetched = agent.current_episode - first_episode
+            if episodes_fetched > 0:
+                log = {}
+                log["Name"] = agent.full_name_id
+                if agent.task_id is not None:
+                    log["Worker"] = agent.task_id
+                log["Fetched episodes"] = episodes_fetched
+                log["Fetched steps"] = steps_fetched
+                log["Episodes"] = "{}-{}".format(first_episode + 1, agent.current_episode)
+                log["Steps"] = agent.total_steps_counter
+                log["Training iteration"] = agent.training_iteration
+                screen.log_dict(log, prefix=RunPhase.TRAIN.value)
 
     def setup_memory_backend(self) -> None:
         if hasattr(self.agent_params.memory, 'memory_backend_params'):
@@ -210,7 +210,7 @@ class LevelManager(EnvironmentInterface):
         Return the agent in this level that gets to act in the environment
         :return: Agent
         """
-        return list(self.agents.values())[0]
+        return next(iter(self.agents.values()))
 
     def step(self, action: Union[None, Dict[str, ActionType]]) -> EnvResponse:
         """
@@ -49,3 +49,6 @@ class MemoryBackend(object):
 
     def fetch(self, num_steps=0):
         raise NotImplemented("Not yet implemented")
+
+    def discard_pending(self):
+        pass
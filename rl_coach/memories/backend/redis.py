@@ -54,6 +54,7 @@ class RedisPubSubBackend(MemoryBackend):
         self.redis_connection = redis.Redis(self.params.redis_address, self.params.redis_port)
         self.redis_server_name = 'redis-server-{}'.format(uuid.uuid4())
         self.redis_service_name = 'redis-service-{}'.format(uuid.uuid4())
+        self._redis_sub = None
 
     def store(self, obj):
         """
@@ -175,11 +176,31 @@ class RedisPubSubBackend(MemoryBackend):
     def sample(self, size):
         pass
 
+    def _get_redis_sub(self):
+        """
+        The subscription to the channel is created on the first fetch and kept open afterwards, so that each fetch
+        does not open a new connection. Experiences which are published but not consumed by a fetch stay buffered on
+        the subscription until discard_pending() is called.
+        """
+        if self._redis_sub is None:
+            self._redis_sub = RedisSub(redis_address=self.params.redis_address, redis_port=self.params.redis_port,
+                                       channel=self.params.channel)
+        return self._redis_sub
+
     def fetch(self, num_consecutive_playing_steps=None):
         """
         :param num_consecutive_playing_steps: The number steps to fetch.
         """
-        return RedisSub(redis_address=self.params.redis_address, redis_port=self.params.redis_port, channel=self.params.channel).run(num_consecutive_playing_steps)
+        return self._get_redis_sub().run(num_consecutive_playing_steps)
+
+    def discard_pending(self):
+        """
+        Drop the experiences which were received on the subscription but not consumed by a fetch yet. In SYNC mode
+        this is called right before a new policy is published, so that the next fetch only holds experiences of the
+        new policy and the leftovers of the rollout workers do not pile up on the subscription.
+        """
+        if self._redis_sub is not None:
+            self._redis_sub.discard_pending()
 
     def subscribe(self, agent):
         """
@@ -232,3 +253,10 @@ class RedisSub(object):
 
             if steps >= num_consecutive_playing_steps.num_steps:
                 break
+
+    def discard_pending(self):
+        """
+        Drop all the messages which were already received on the subscription.
+        """
+        while self.pubsub.get_message() is not None:
+            pass
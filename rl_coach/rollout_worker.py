@@ -85,21 +85,25 @@ def rollout_worker(graph_manager, data_store, num_workers, task_parameters):
 
     data_store.load_policy(graph_manager, require_new_policy=False, timeout=60)
 
+    algorithm_params = graph_manager.agent_params.algorithm
+
     with graph_manager.phase_context(RunPhase.TRAIN):
         # this worker should play a fraction of the total playing steps per rollout
         graph_manager.reset_internal_state(force_environment_reset=True)
 
         act_steps = (
-            graph_manager.agent_params.algorithm.num_consecutive_playing_steps
+            algorithm_params.num_consecutive_playing_steps
             / num_workers
         )
+        act_for_full_episodes = algorithm_params.act_for_full_episodes
+
         for i in range(graph_manager.improve_steps / act_steps):
             if data_store.end_of_policies():
                 break
 
             graph_manager.act(
                 act_steps,
-                wait_for_full_episodes=graph_manager.agent_params.algorithm.act_for_full_episodes,
+                wait_for_full_episodes=act_for_full_episodes,
             )
 
             data_store.load_policy(graph_manager, require_new_policy=True, timeout=timeout)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from rl_coach.agents.agent import Agent
+from rl_coach.core_types import Transition
+
+
+@pytest.fixture()
+def agent():
+    # only the replay dtype related members of the agent are needed, so the agent itself is not fully initialized
+    agent = Agent.__new__(Agent)
+    agent.replay_dtype = Agent._get_replay_dtype(np.float16)
+    agent._last_next_state = None
+    agent._last_cast_next_state = None
+    return agent
+
+
+@pytest.mark.unit_test
+def test_get_replay_dtype():
+    assert Agent._get_replay_dtype(None) is None
+    assert Agent._get_replay_dtype(np.float16) == np.float16
+    assert Agent._get_replay_dtype('float32') == np.float32
+    with pytest.raises(ValueError):
+        Agent._get_replay_dtype(np.int8)
+    with pytest.raises(ValueError):
+        Agent._get_replay_dtype(np.uint8)
+
+
+@pytest.mark.unit_test
+def test_cast_observations(agent):
+    state = {
+        'observation': np.ones(4, dtype=np.float32),
+        'measurements': np.ones(2, dtype=np.float16),
+        'image': np.ones((2, 2), dtype=np.uint8),
+    }
+    cast_state = agent._cast_observations(state)
+
+    assert cast_state['observation'].dtype == np.float16
+    assert np.all(cast_state['observation'] == 1)
+    assert cast_state['measurements'] is state['measurements']
+    assert cast_state['image'] is state['image']
+    assert state['observation'].dtype == np.float32
+
+
+@pytest.mark.unit_test
+def test_cast_transition_observations_shares_consecutive_states(agent):
+    states = [{'observation': np.full(4, i, dtype=np.float32)} for i in range(3)]
+    transitions = [Transition(state=dict(states[i]), action=0, reward=0, next_state=states[i + 1]) for i in range(2)]
+    for transition in transitions:
+        agent._cast_transition_observations(transition)
+
+    for i, transition in enumerate(transitions):
+        assert transition.state['observation'].dtype == np.float16
+        assert transition.next_state['observation'].dtype == np.float16
+        assert np.all(transition.state['observation'] == i)
+        assert np.all(transition.next_state['observation'] == i + 1)
+
+    # the next state of the first transition and the state of the second one hold the same cast observation
+    assert transitions[1].state['observation'] is transitions[0].next_state['observation']
+    assert transitions[1].state is not transitions[0].next_state
+
+    # the acting states are not modified
+    assert all(state['observation'].dtype == np.float32 for state in states)
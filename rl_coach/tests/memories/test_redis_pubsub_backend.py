@@ -0,0 +1,75 @@
+import pickle
+from collections import deque
+
+import numpy as np
+import pytest
+
+from rl_coach.core_types import EnvironmentSteps, Transition
+from rl_coach.memories.backend.redis import RedisPubSubBackend, RedisPubSubMemoryBackendParameters, RedisSub
+
+
+class FakePubSub(object):
+    def __init__(self):
+        self.messages = deque([{'type': 'subscribe', 'data': 1}])
+
+    def publish(self, obj):
+        self.messages.append({'type': 'message', 'data': pickle.dumps(obj)})
+
+    def listen(self):
+        while self.messages:
+            yield self.messages.popleft()
+
+    def get_message(self):
+        if self.messages:
+            return self.messages.popleft()
+        return None
+
+
+@pytest.fixture()
+def backend_and_pubsub():
+    backend = RedisPubSubBackend(RedisPubSubMemoryBackendParameters(redis_address="localhost"))
+    pubsub = FakePubSub()
+    redis_sub = RedisSub.__new__(RedisSub)
+    redis_sub.pubsub = pubsub
+    backend._redis_sub = redis_sub
+    return backend, pubsub
+
+
+def transition(policy):
+    return Transition(state={'observation': np.array([policy])}, action=0, reward=policy, game_over=False)
+
+
+@pytest.mark.unit_test
+def test_redis_pubsub_backend_fetch_keeps_overflow(backend_and_pubsub):
+    backend, pubsub = backend_and_pubsub
+    for _ in range(3):
+        pubsub.publish(transition(0))
+
+    assert len(list(backend.fetch(EnvironmentSteps(2)))) == 2
+    assert len(pubsub.messages) == 1
+
+
+@pytest.mark.unit_test
+def test_redis_pubsub_backend_discard_pending_drops_overflow(backend_and_pubsub):
+    backend, pubsub = backend_and_pubsub
+
+    # the rollout workers played more steps with the first policy than the trainer fetched
+    for _ in range(3):
+        pubsub.publish(transition(0))
+    list(backend.fetch(EnvironmentSteps(2)))
+
+    # a new policy is published, and the rollout workers play with it
+    backend.discard_pending()
+    for _ in range(2):
+        pubsub.publish(transition(1))
+
+    transitions = list(backend.fetch(EnvironmentSteps(2)))
+    assert [t.reward for t in transitions] == [1, 1]
+    assert len(pubsub.messages) == 0
+
+
+@pytest.mark.unit_test
+def test_redis_pubsub_backend_discard_pending_before_first_fetch():
+    backend = RedisPubSubBackend(RedisPubSubMemoryBackendParameters(redis_address="localhost"))
+    backend.discard_pending()
+    assert backend._redis_sub is None
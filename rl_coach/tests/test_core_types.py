@@ -5,8 +5,11 @@ from rl_coach.core_types import (
     StepMethod,
     EnvironmentSteps,
     EnvironmentEpisodes,
+    Episode,
+    Transition,
 )
 
+import numpy as np
 import pytest
 
 
@@ -62,3 +65,28 @@ def test_step_method_rdiv():
 def test_step_method_div_type():
     with pytest.raises(TypeError):
         EnvironmentEpisodes(10) / EnvironmentSteps(2)
+
+
+@pytest.mark.unit_test
+def test_episode_n_step_discounted_rewards():
+    episode = Episode(discount=0.5, n_step=2)
+    for reward in [1, 2, 3, 4]:
+        episode.insert(Transition(state={}, action=0, reward=reward, game_over=reward == 4))
+    episode.update_discounted_rewards()
+    assert np.allclose([t.n_step_discounted_rewards for t in episode.transitions], [2, 3.5, 5, 4])
+
+    episode.n_step = -1
+    episode.update_discounted_rewards()
+    assert np.allclose([t.n_step_discounted_rewards for t in episode.transitions], [3.25, 4.5, 5, 4])
+
+
+@pytest.mark.unit_test
+def test_n_step_discounted_rewards_numba_matches_numpy():
+    pytest.importorskip("numba")
+    from rl_coach.core_types import _n_step_discounted_rewards_numba, _n_step_discounted_rewards_numpy
+
+    rewards = np.random.RandomState(0).uniform(-10, 10, size=50)
+    for discount in [0.5, 0.99, 1.]:
+        for n_step in [1, 2, 5, 49, 50]:
+            assert np.array_equal(_n_step_discounted_rewards_numba(rewards, discount, n_step),
+                                  _n_step_discounted_rewards_numpy(rewards, discount, n_step))
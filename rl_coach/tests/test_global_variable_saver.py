@@ -77,3 +77,16 @@ def test_global_variable_saver_from_string(variable, name, shape):
         saver.from_string(session, pickle.dumps({name: np.ones(shape)}, protocol=-1))
         arrays = saver.to_arrays(session)
         assert_arrays_ones_shape(arrays, shape, name)
+
+
+@pytest.mark.unit_test
+def test_global_variable_saver_from_arrays_partial(variable, name, shape):
+    other_variable = tf.Variable(tf.zeros(shape), name=random_name())
+    with tf.Session() as session:
+        session.run(tf.global_variables_initializer())
+
+        saver = GlobalVariableSaver("name")
+        saver.from_arrays(session, {name: np.ones(shape)}, partial=True)
+        arrays = saver.to_arrays(session)
+        assert np.all(arrays[name] == np.ones(shape))
+        assert np.all(arrays[other_variable.name.split(":")[0]] == np.zeros(shape))
@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from rl_coach.data_stores.data_store import DataStoreParameters
+from rl_coach.data_stores.redis_data_store import RedisDataStore, RedisDataStoreParameters
+
+
+class FakeRedis(object):
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+        self.hmget_calls = 0
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        value = int(self.values.get(key, 0)) + 1
+        self.values[key] = str(value).encode()
+        return value
+
+    def hmset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({name.encode(): value for name, value in mapping.items()})
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hmget(self, key, names):
+        self.hmget_calls += 1
+        return [self.hashes.get(key, {}).get(name) for name in names]
+
+    def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    def publish(self, channel, message):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline(object):
+    def __init__(self, redis_connection):
+        self.redis_connection = redis_connection
+        self.commands = []
+
+    def __getattr__(self, name):
+        def command(*args):
+            self.commands.append((name, args))
+        return command
+
+    def execute(self):
+        return [getattr(self.redis_connection, name)(*args) for name, args in self.commands]
+
+
+class FakeSaver(object):
+    def __init__(self, arrays=None):
+        self.arrays = dict(arrays or {})
+        self.loads = []
+
+    def to_arrays(self, session):
+        return {name: array.copy() for name, array in self.arrays.items()}
+
+    def from_arrays(self, session, tensors, partial=False):
+        self.loads.append((sorted(tensors), partial))
+        self.arrays.update(tensors)
+
+
+def data_store(redis_connection, saver):
+    params = RedisDataStoreParameters(DataStoreParameters("redis", "kubernetes", {}), redis_channel="channel")
+    store = RedisDataStore(params)
+    store.redis_connection = redis_connection
+    store.saver = saver
+    return store
+
+
+@pytest.fixture()
+def stores():
+    redis_connection = FakeRedis()
+    trainer_saver = FakeSaver({'a': np.zeros(3), 'b': np.zeros(2)})
+    trainer = data_store(redis_connection, trainer_saver)
+    worker = data_store(redis_connection, FakeSaver())
+    return redis_connection, trainer, worker
+
+
+@pytest.mark.unit_test
+def test_redis_data_store_delta_load(stores):
+    redis_connection, trainer, worker = stores
+    graph_manager = SimpleNamespace(sess=None)
+
+    # nothing was published yet
+    assert not worker._load_policy(graph_manager)
+
+    # the first load fetches all the variables
+    trainer.save_policy(graph_manager)
+    assert worker._load_policy(graph_manager)
+    assert worker.saver.loads == [(['a', 'b'], False)]
+
+    # only the changed variables are fetched afterwards
+    trainer.saver.arrays['b'] = np.ones(2)
+    trainer.save_policy(graph_manager)
+    assert worker._load_policy(graph_manager)
+    assert worker.saver.loads[-1] == (['b'], True)
+    assert np.all(worker.saver.arrays['b'] == 1)
+
+    # nothing is fetched when the policy id is unchanged
+    hmget_calls = redis_connection.hmget_calls
+    assert worker._load_policy(graph_manager)
+    assert redis_connection.hmget_calls == hmget_calls
+    assert len(worker.saver.loads) == 2
+
+
+@pytest.mark.unit_test
+def test_redis_data_store_resends_lost_variables(stores):
+    redis_connection, trainer, worker = stores
+    graph_manager = SimpleNamespace(sess=None)
+    trainer.save_policy(graph_manager)
+
+    # the stored variables are lost, e.g. redis was restarted
+    redis_connection.hashes.clear()
+    trainer.save_policy(graph_manager)
+
+    assert worker._load_policy(graph_manager)
+    assert worker.saver.loads == [(['a', 'b'], False)]
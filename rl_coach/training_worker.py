@@ -77,6 +77,9 @@ def training_worker(graph_manager, task_parameters, data_store, is_multi_node_te
                     break
 
             if graph_manager.agent_params.algorithm.distributed_coach_synchronization_type == DistributedCoachSynchronizationType.SYNC:
+                # the experiences the rollout workers played beyond the fetched steps come from the previous policy
+                if hasattr(graph_manager, 'memory_backend'):
+                    graph_manager.memory_backend.discard_pending()
                 data_store.save_policy(graph_manager)
             else:
                 # NOTE: this implementation conflated occasionally saving checkpoints for later use